@@ -12,3 +12,8 @@ KEEP_MRS_WITHOUT_CHANNEL: timedelta = timedelta(minutes=15)
 # bursts of messages, this is only enforced as an average over 5 minutes.
 MATRIX_RATE_LIMIT_ALLOWED_BYTES = 5_000_000
 MATRIX_RATE_LIMIT_RESET_INTERVAL = timedelta(minutes=5)
+
+# Bound on messages waiting to be processed. Messages beyond this are
+# dropped, which keeps memory usage limited when senders outpace the
+# message handlers.
+MATRIX_MAX_QUEUED_MESSAGES = 256
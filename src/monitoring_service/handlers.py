@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import cast
 
 import structlog
@@ -66,12 +67,21 @@ def channel_opened_event_handler(event: Event, context: Context) -> None:
     )
 
 
+@lru_cache(maxsize=None)
+def _get_token_network_contract(w3: Web3, token_network_address: TokenNetworkAddress) -> Contract:
+    """Contract instances are cached since building one parses the whole ABI.
+
+    One instance per token network is enough, the contract objects are
+    stateless apart from their address.
+    """
+    abi = CONTRACT_MANAGER.get_contract_abi(CONTRACT_TOKEN_NETWORK)
+    return w3.eth.contract(abi=abi, address=token_network_address)
+
+
 def _first_allowed_block_to_monitor(
     token_network_address: TokenNetworkAddress, channel: Channel, context: Context
 ) -> BlockNumber:
-    # Get token_network_contract
-    abi = CONTRACT_MANAGER.get_contract_abi(CONTRACT_TOKEN_NETWORK)
-    token_network_contract = context.w3.eth.contract(abi=abi, address=token_network_address)
+    token_network_contract = _get_token_network_contract(context.w3, token_network_address)
 
     # Use the same assumptions as the MS contract, which can't get the real
     # channel timeout and close block.
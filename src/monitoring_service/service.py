@@ -17,7 +17,7 @@ from monitoring_service.constants import (
 from monitoring_service.database import Database
 from monitoring_service.handlers import HANDLERS, Context
 from raiden.settings import DEFAULT_NUMBER_OF_BLOCK_CONFIRMATIONS
-from raiden.utils.typing import BlockNumber, ChainID
+from raiden.utils.typing import BlockNumber
 from raiden_contracts.constants import (
     CONTRACT_MONITORING_SERVICE,
     CONTRACT_TOKEN_NETWORK_REGISTRY,
@@ -26,8 +26,8 @@ from raiden_contracts.constants import (
 from raiden_contracts.contract_manager import gas_measurements
 from raiden_libs.blockchain import get_blockchain_events
 from raiden_libs.contract_info import CONTRACT_MANAGER
-from raiden_libs.events import Event
-from raiden_libs.utils import private_key_to_address
+from raiden_libs.events import Event, UpdatedHeadBlockEvent
+from raiden_libs.utils import get_web3_chain_id, private_key_to_address
 
 log = structlog.get_logger(__name__)
 
@@ -67,20 +67,29 @@ class MonitoringService:  # pylint: disable=too-few-public-methods
         sync_start_block: BlockNumber = BlockNumber(0),
         required_confirmations: int = DEFAULT_NUMBER_OF_BLOCK_CONFIRMATIONS,
         poll_interval: float = 1,
+        max_poll_interval: float = None,
         min_reward: int = 0,
+        max_filter_interval: int = MAX_FILTER_INTERVAL,
     ):
         self.web3 = web3
         self.private_key = private_key
         self.address = private_key_to_address(private_key)
         self.required_confirmations = required_confirmations
         self.poll_interval = poll_interval
+        # When no events arrive, the polling frequency is gradually reduced
+        # down to this interval to save RPC requests.
+        self.max_poll_interval = max_poll_interval or 10 * poll_interval
+        # Maximum number of blocks queried in a single `eth_getLogs` call.
+        # Response times grow super-linearly with the block range, so this
+        # can be lowered for nodes that time out on large ranges.
+        self.max_filter_interval = max_filter_interval
 
         web3.middleware_stack.add(construct_sign_and_send_raw_middleware(private_key))
 
         monitoring_contract = contracts[CONTRACT_MONITORING_SERVICE]
         user_deposit_contract = contracts[CONTRACT_USER_DEPOSIT]
 
-        chain_id = ChainID(int(web3.net.version))
+        chain_id = get_web3_chain_id(web3)
         self.database = Database(
             filename=db_filename,
             chain_id=chain_id,
@@ -105,6 +114,7 @@ class MonitoringService:  # pylint: disable=too-few-public-methods
         self, wait_function: Callable = time.sleep, check_account_gas_reserve: bool = True
     ) -> None:
         last_gas_check_block = 0
+        poll_interval = self.poll_interval
         while True:
             last_confirmed_block = self.web3.eth.blockNumber - self.required_confirmations
 
@@ -118,21 +128,36 @@ class MonitoringService:  # pylint: disable=too-few-public-methods
                 last_gas_check_block = last_confirmed_block
 
             max_query_interval_end_block = (
-                self.context.ms_state.blockchain_state.latest_known_block + MAX_FILTER_INTERVAL
+                self.context.ms_state.blockchain_state.latest_known_block
+                + self.max_filter_interval
             )
             # Limit the max number of blocks that is processed per iteration
             last_block = min(last_confirmed_block, max_query_interval_end_block)
 
-            self._process_new_blocks(last_block)
+            saw_events = self._process_new_blocks(last_block)
             self._purge_old_monitor_requests()
 
+            # Poll quickly while events keep arriving or while the service is
+            # still catching up towards the confirmed head in
+            # max_filter_interval sized chunks; back off exponentially on
+            # quiet ticks at the head to reduce the steady-state RPC load.
+            if saw_events or last_block < last_confirmed_block:
+                poll_interval = self.poll_interval
+            else:
+                poll_interval = min(poll_interval * 1.5, self.max_poll_interval)
+
             try:
-                wait_function(self.poll_interval)
+                wait_function(poll_interval)
             except KeyboardInterrupt:
                 log.info("Shutting down")
                 sys.exit(0)
 
-    def _process_new_blocks(self, last_block: BlockNumber) -> None:
+    def _process_new_blocks(self, last_block: BlockNumber) -> bool:
+        """Process all events up to ``last_block``.
+
+        Returns whether any on-chain events were seen, so that the caller can
+        adapt its polling frequency.
+        """
         self.context.last_known_block = last_block
 
         # BCL return a new state and events related to channel lifecycle
@@ -158,6 +183,7 @@ class MonitoringService:  # pylint: disable=too-few-public-methods
 
         # Now set the updated chain state to the context, will be stored later
         self.context.ms_state.blockchain_state = new_chain_state
+        saw_events = any(not isinstance(event, UpdatedHeadBlockEvent) for event in events)
         for event in events:
             handle_event(event, self.context)
 
@@ -190,6 +216,8 @@ class MonitoringService:  # pylint: disable=too-few-public-methods
                         receipt=receipt,
                     )
 
+        return saw_events
+
     def _purge_old_monitor_requests(self) -> None:
         """ Delete all old MRs for which still no channel exists.
 
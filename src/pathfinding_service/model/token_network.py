@@ -151,6 +151,10 @@ class TokenNetwork:
         self.address = token_network_address
         self.channel_id_to_addresses: Dict[ChannelID, Tuple[Address, Address]] = dict()
         self.G = DiGraph()
+        # Flat index over the graph's edge views. Lookups of single channel
+        # views go through one dict instead of the graph's nested dicts; the
+        # graph remains the source for the routing algorithms.
+        self._edge_views: Dict[Tuple[Address, Address], ChannelView] = dict()
 
     def __repr__(self) -> str:
         return (
@@ -207,6 +211,26 @@ class TokenNetwork:
                 channel_view.participant2,
             )
         self.G.add_edge(channel_view.participant1, channel_view.participant2, view=channel_view)
+        self._edge_views[(channel_view.participant1, channel_view.participant2)] = channel_view
+
+    def add_channel_views(self, channel_views: List[ChannelView]) -> None:
+        """ Register many channel views in a single batch.
+
+        Same semantics as calling `add_channel_view` for each element, but
+        builds the graph with one `add_edges_from` call.
+        """
+        for channel_view in channel_views:
+            self.channel_id_to_addresses.setdefault(
+                channel_view.channel_id, (channel_view.participant1, channel_view.participant2)
+            )
+        self.G.add_edges_from(
+            (channel_view.participant1, channel_view.participant2, {"view": channel_view})
+            for channel_view in channel_views
+        )
+        self._edge_views.update(
+            ((channel_view.participant1, channel_view.participant2), channel_view)
+            for channel_view in channel_views
+        )
 
     def handle_channel_new_deposit_event(
         self, channel_identifier: ChannelID, receiver: Address, total_deposit: TokenAmount
@@ -218,9 +242,9 @@ class TokenNetwork:
         try:
             participant1, participant2 = self.channel_id_to_addresses[channel_identifier]
             if receiver == participant1:
-                channel_view = self.G[participant1][participant2]["view"]
+                channel_view = self._edge_views[(participant1, participant2)]
             elif receiver == participant2:
-                channel_view = self.G[participant2][participant1]["view"]
+                channel_view = self._edge_views[(participant2, participant1)]
             else:
                 log.error("Receiver in ChannelNewDeposit does not fit the internal channel")
                 return None
@@ -246,18 +270,24 @@ class TokenNetwork:
 
             self.G.remove_edge(participant1, participant2)
             self.G.remove_edge(participant2, participant1)
+            del self._edge_views[(participant1, participant2)]
+            del self._edge_views[(participant2, participant1)]
         except KeyError:
             log.error(
                 "Received ChannelClosed event for unknown channel",
                 channel_identifier=channel_identifier,
             )
 
+    def view(self, participant1: Address, participant2: Address) -> ChannelView:
+        """ Returns the channel view from participant1 towards participant2. """
+        return self._edge_views[(participant1, participant2)]
+
     def get_channel_views_for_partner(
         self, updating_participant: Address, other_participant: Address
     ) -> Tuple[ChannelView, ChannelView]:
         # Get the channel views from the perspective of the updating participant
-        channel_view_to_partner = self.G[updating_participant][other_participant]["view"]
-        channel_view_from_partner = self.G[other_participant][updating_participant]["view"]
+        channel_view_to_partner = self._edge_views[(updating_participant, other_participant)]
+        channel_view_from_partner = self._edge_views[(other_participant, updating_participant)]
 
         return channel_view_to_partner, channel_view_from_partner
 
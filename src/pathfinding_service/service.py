@@ -20,7 +20,7 @@ from pathfinding_service.typing import DeferableMessage
 from raiden.constants import PATH_FINDING_BROADCASTING_ROOM, UINT256_MAX
 from raiden.messages import Message, PFSCapacityUpdate, PFSFeeUpdate
 from raiden.network.transport.matrix import AddressReachability
-from raiden.utils.typing import Address, BlockNumber, ChainID, TokenNetworkAddress
+from raiden.utils.typing import Address, BlockNumber, TokenNetworkAddress
 from raiden_contracts.constants import CONTRACT_TOKEN_NETWORK_REGISTRY, CONTRACT_USER_DEPOSIT
 from raiden_libs.blockchain import get_blockchain_events
 from raiden_libs.contract_info import CONTRACT_MANAGER
@@ -35,7 +35,7 @@ from raiden_libs.events import (
 from raiden_libs.gevent_error_handler import register_error_handler
 from raiden_libs.matrix import MatrixListener
 from raiden_libs.states import BlockchainState
-from raiden_libs.utils import private_key_to_address
+from raiden_libs.utils import get_web3_chain_id, private_key_to_address
 
 log = structlog.get_logger(__name__)
 
@@ -61,17 +61,23 @@ class PathfindingService(gevent.Greenlet):
         sync_start_block: BlockNumber = BlockNumber(0),
         required_confirmations: int = 8,
         poll_interval: float = 10,
+        max_filter_interval: int = MAX_FILTER_INTERVAL,
     ):
         super().__init__()
 
         self.web3 = web3
         self.registry_address = contracts[CONTRACT_TOKEN_NETWORK_REGISTRY].address
         self.user_deposit_contract = contracts[CONTRACT_USER_DEPOSIT]
-        self.chain_id = ChainID(int(web3.net.version))
+        self.chain_id = get_web3_chain_id(web3)
         self.address = private_key_to_address(private_key)
         self._required_confirmations = required_confirmations
         self._poll_interval = poll_interval
-        self._is_running = gevent.event.Event()
+        # Upper bound on the block range of a single `eth_getLogs` call, can
+        # be lowered for RPC nodes that time out on large ranges.
+        self._max_filter_interval = max_filter_interval
+        # Plain flag instead of a gevent.event.Event: the loop below only
+        # polls it between iterations, so no event bookkeeping is needed.
+        self._stop_requested = False
 
         log.info("PFS payment address", address=self.address)
 
@@ -127,11 +133,11 @@ class PathfindingService(gevent.Greenlet):
             registry_address=self.registry_address,
             start_block=self.database.get_latest_known_block(),
         )
-        while not self._is_running.is_set():
+        while not self._stop_requested:
             last_confirmed_block = self.web3.eth.blockNumber - self._required_confirmations
 
             max_query_interval_end_block = (
-                self.database.get_latest_known_block() + MAX_FILTER_INTERVAL
+                self.database.get_latest_known_block() + self._max_filter_interval
             )
             # Limit the max number of blocks that is processed per iteration
             last_block = min(last_confirmed_block, max_query_interval_end_block)
@@ -159,7 +165,7 @@ class PathfindingService(gevent.Greenlet):
 
     def stop(self) -> None:
         self.matrix_listener.stop()
-        self._is_running.set()
+        self._stop_requested = True
         self.matrix_listener.join()
 
     def follows_token_network(self, token_network_address: TokenNetworkAddress) -> bool:
@@ -1,5 +1,6 @@
 from copy import deepcopy
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 import structlog
 from eth_utils import decode_hex, encode_hex, to_checksum_address
@@ -35,13 +36,28 @@ from raiden_libs.states import BlockchainState
 log = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
 def create_registry_event_topics(contract_manager: ContractManager) -> List:
+    """Topic filter for TokenNetworkCreated events, cached since it hashes the ABI."""
     new_network_abi = contract_manager.get_event_abi(
         CONTRACT_TOKEN_NETWORK_REGISTRY, EVENT_TOKEN_NETWORK_CREATED
     )
     return [encode_hex(event_abi_to_log_topic(new_network_abi))]
 
 
+@lru_cache(maxsize=None)
+def get_topic_to_event_abi(
+    contract_manager: ContractManager, contract_name: str
+) -> Dict[bytes, Dict]:
+    """Maps event log topics to the matching event ABI of the given contract.
+
+    Computing a log topic requires hashing the ABI encoded event signature,
+    so the result is cached. The ABIs don't change during a run.
+    """
+    events_abi = filter_by_type("event", contract_manager.get_contract_abi(contract_name))
+    return {event_abi_to_log_topic(event_abi): event_abi for event_abi in events_abi}
+
+
 def decode_event(topic_to_event_abi: Dict[bytes, Dict], log_entry: Dict) -> Dict:
     topic = log_entry["topics"][0]
     event_abi = topic_to_event_abi[topic]
@@ -52,7 +68,7 @@ def decode_event(topic_to_event_abi: Dict[bytes, Dict], log_entry: Dict) -> Dict
 def query_blockchain_events(
     web3: Web3,
     contract_manager: ContractManager,
-    contract_address: Address,
+    contract_addresses: List[Address],
     contract_name: str,
     topics: List,
     from_block: BlockNumber,
@@ -60,25 +76,28 @@ def query_blockchain_events(
 ) -> List[Dict]:
     """Returns events emmitted by a contract for a given event name, within a certain range.
 
+    Queries all given contracts with a single `eth_getLogs` call. This keeps
+    the number of RPC round trips constant, no matter how many contracts of
+    the same type (e.g. token networks) are watched.
+
     Args:
         web3: A Web3 instance
         contract_manager: A contract manager
-        contract_address: The address of the contract to be filtered, can be `None`
+        contract_addresses: The addresses of the contracts to be filtered
         contract_name: The name of the contract
         topics: The topics to filter for
         from_block: The block to start search events
         to_block: The block to stop searching for events
 
     Returns:
-        All matching events
+        All matching events, ordered by block
     """
-    events_abi = filter_by_type("event", contract_manager.get_contract_abi(contract_name))
-    topic_to_event_abi = {event_abi_to_log_topic(event_abi): event_abi for event_abi in events_abi}
+    topic_to_event_abi = get_topic_to_event_abi(contract_manager, contract_name)
 
     filter_params = {
         "fromBlock": from_block,
         "toBlock": to_block,
-        "address": to_checksum_address(contract_address),
+        "address": [to_checksum_address(address) for address in contract_addresses],
         "topics": topics,
     }
 
@@ -87,42 +106,63 @@ def query_blockchain_events(
     return [decode_event(topic_to_event_abi, log_entry) for log_entry in events]
 
 
+def _parse_channel_opened(args: Dict, common_infos: Dict) -> Event:
+    return ReceiveChannelOpenedEvent(
+        participant1=decode_hex(args["participant1"]),
+        participant2=decode_hex(args["participant2"]),
+        settle_timeout=args["settle_timeout"],
+        **common_infos,
+    )
+
+
+def _parse_channel_new_deposit(args: Dict, common_infos: Dict) -> Event:
+    return ReceiveChannelNewDepositEvent(
+        participant_address=decode_hex(args["participant"]),
+        total_deposit=args["total_deposit"],
+        **common_infos,
+    )
+
+
+def _parse_channel_closed(args: Dict, common_infos: Dict) -> Event:
+    return ReceiveChannelClosedEvent(
+        closing_participant=decode_hex(args["closing_participant"]), **common_infos
+    )
+
+
+def _parse_channel_balance_proof_updated(args: Dict, common_infos: Dict) -> Event:
+    return ReceiveNonClosingBalanceProofUpdatedEvent(
+        closing_participant=decode_hex(args["closing_participant"]),
+        nonce=args["nonce"],
+        **common_infos,
+    )
+
+
+def _parse_channel_settled(_args: Dict, common_infos: Dict) -> Event:
+    return ReceiveChannelSettledEvent(**common_infos)
+
+
+# Prebuilt dispatch table, so that each log costs a single dict lookup
+# instead of a chain of string comparisons.
+TOKEN_NETWORK_EVENT_PARSERS: Dict[str, Callable[[Dict, Dict], Event]] = {
+    ChannelEvent.OPENED: _parse_channel_opened,
+    ChannelEvent.DEPOSIT: _parse_channel_new_deposit,
+    ChannelEvent.CLOSED: _parse_channel_closed,
+    ChannelEvent.BALANCE_PROOF_UPDATED: _parse_channel_balance_proof_updated,
+    ChannelEvent.SETTLED: _parse_channel_settled,
+}
+
+
 def parse_token_network_event(event: dict) -> Optional[Event]:
-    event_name = event["event"]
+    parse = TOKEN_NETWORK_EVENT_PARSERS.get(event["event"])
+    if parse is None:
+        return None
 
     common_infos = dict(
         token_network_address=decode_hex(event["address"]),
         channel_identifier=event["args"]["channel_identifier"],
         block_number=event["blockNumber"],
     )
-
-    if event_name == ChannelEvent.OPENED:
-        return ReceiveChannelOpenedEvent(
-            participant1=decode_hex(event["args"]["participant1"]),
-            participant2=decode_hex(event["args"]["participant2"]),
-            settle_timeout=event["args"]["settle_timeout"],
-            **common_infos,
-        )
-    if event_name == ChannelEvent.DEPOSIT:
-        return ReceiveChannelNewDepositEvent(
-            participant_address=decode_hex(event["args"]["participant"]),
-            total_deposit=event["args"]["total_deposit"],
-            **common_infos,
-        )
-    if event_name == ChannelEvent.CLOSED:
-        return ReceiveChannelClosedEvent(
-            closing_participant=decode_hex(event["args"]["closing_participant"]), **common_infos
-        )
-    if event_name == ChannelEvent.BALANCE_PROOF_UPDATED:
-        return ReceiveNonClosingBalanceProofUpdatedEvent(
-            closing_participant=decode_hex(event["args"]["closing_participant"]),
-            nonce=event["args"]["nonce"],
-            **common_infos,
-        )
-    if event_name == ChannelEvent.SETTLED:
-        return ReceiveChannelSettledEvent(**common_infos)
-
-    return None
+    return parse(event["args"], common_infos)
 
 
 def get_blockchain_events(
@@ -145,7 +185,7 @@ def get_blockchain_events(
     registry_events = query_blockchain_events(
         web3=web3,
         contract_manager=contract_manager,
-        contract_address=new_chain_state.token_network_registry_address,
+        contract_addresses=[new_chain_state.token_network_registry_address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=create_registry_event_topics(contract_manager),
         from_block=from_block,
@@ -163,12 +203,15 @@ def get_blockchain_events(
         )
         new_chain_state.token_network_addresses.append(event_dict["args"]["token_network_address"])
 
-    # then check all token networks
-    for token_network_address in new_chain_state.token_network_addresses:
+    # then check all token networks with a single batched query
+    if new_chain_state.token_network_addresses:
         network_events = query_blockchain_events(
             web3=web3,
             contract_manager=contract_manager,
-            contract_address=Address(token_network_address),
+            contract_addresses=[
+                Address(token_network_address)
+                for token_network_address in new_chain_state.token_network_addresses
+            ],
             contract_name=CONTRACT_TOKEN_NETWORK,
             topics=[None],
             from_block=from_block,
@@ -210,7 +253,7 @@ def get_monitoring_blockchain_events(
     monitoring_service_events = query_blockchain_events(
         web3=web3,
         contract_manager=contract_manager,
-        contract_address=chain_state.monitor_contract_address,
+        contract_addresses=[chain_state.monitor_contract_address],
         contract_name=CONTRACT_MONITORING_SERVICE,
         topics=[None],
         from_block=from_block,
@@ -17,7 +17,7 @@ from web3.contract import Contract
 from web3.middleware import geth_poa_middleware
 
 from pathfinding_service.middleware import http_retry_with_backoff_middleware
-from raiden.utils.typing import Address, BlockNumber, ChainID
+from raiden.utils.typing import Address, BlockNumber
 from raiden_contracts.constants import (
     CONTRACT_MONITORING_SERVICE,
     CONTRACT_ONE_TO_N,
@@ -28,6 +28,7 @@ from raiden_contracts.constants import (
 )
 from raiden_libs.contract_info import CONTRACT_MANAGER, get_contract_addresses_and_start_block
 from raiden_libs.logging import setup_logging
+from raiden_libs.utils import get_web3_chain_id
 
 log = structlog.get_logger(__name__)
 
@@ -105,7 +106,7 @@ def common_options(app_name: str) -> Callable:
                 setup_logging(params.pop("log_level"))
                 if not params["state_db"]:
                     # only RC has `chain_id`, MS and PFS have `web3` object
-                    chain_id = str(params.get("chain_id") or params["web3"].net.version)
+                    chain_id = str(params.get("chain_id") or get_web3_chain_id(params["web3"]))
                     contracts_version = CONTRACTS_VERSION.replace(".", "_")
                     filename = f"{app_name}-{chain_id}-{contracts_version}.db"
                     data_dir = click.get_app_dir(app_name)
@@ -186,7 +187,7 @@ def connect_to_blockchain(
         provider = HTTPProvider(eth_rpc)
         web3 = Web3(provider)
         # Will throw ConnectionError on bad Ethereum client
-        chain_id = ChainID(int(web3.net.version))
+        chain_id = get_web3_chain_id(web3)
     except requests.exceptions.ConnectionError:
         log.error(
             "Can not connect to the Ethereum client. Please check that it is running and that "
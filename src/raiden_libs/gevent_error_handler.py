@@ -1,5 +1,4 @@
 import sys
-import traceback
 from typing import Any
 
 import structlog
@@ -9,19 +8,23 @@ log = structlog.get_logger(__name__)
 ORIGINAL_ERROR_HANDLER = Hub.handle_error
 
 
-def error_handler(_self: Any, _context: Any, etype: Any, value: Any, tb: Any) -> None:
+def error_handler(_self: Any, _context: Any, etype: Any, value: Any, _tb: Any) -> None:
     if issubclass(etype, Hub.NOT_ERROR):
         return
     if issubclass(etype, KeyboardInterrupt):
         log.info("Service termination requested by user.")
         sys.exit()
 
+    # Pass the exception instance instead of an (etype, value, tb) tuple:
+    # the tuple would be mangled into a list by format_to_hex before
+    # format_exc_info sees it, while an exception passes through untouched
+    # and carries its traceback in __traceback__.
     log.critical(
         "Unhandled exception. Terminating the program..."
         "Please report this issue at "
-        "https://github.com/raiden-network/raiden-services/issues"
+        "https://github.com/raiden-network/raiden-services/issues",
+        exc_info=value,
     )
-    traceback.print_exception(etype=etype, value=value, tb=tb)
     sys.exit(1)
 
 
@@ -7,11 +7,13 @@ import gevent
 import structlog
 from eth_utils import decode_hex, to_checksum_address
 from gevent.event import Event
+from gevent.queue import Full, Queue
 from marshmallow import ValidationError
 from matrix_client.errors import MatrixRequestError
 from matrix_client.user import User
 
 from monitoring_service.constants import (
+    MATRIX_MAX_QUEUED_MESSAGES,
     MATRIX_RATE_LIMIT_ALLOWED_BYTES,
     MATRIX_RATE_LIMIT_RESET_INTERVAL,
 )
@@ -182,6 +184,11 @@ class MatrixListener(gevent.Greenlet):
             )
 
         self.startup_finished = Event()
+        # Bounded queue between the sync thread and the message handlers.
+        # Messages are dropped instead of queueing without limit when the
+        # handlers can't keep up.
+        self._message_queue: Queue = Queue(maxsize=MATRIX_MAX_QUEUED_MESSAGES)
+        self._message_worker: Optional[gevent.Greenlet] = None
         self.rate_limiter = RateLimiter(
             allowed_bytes=MATRIX_RATE_LIMIT_ALLOWED_BYTES,
             reset_interval=MATRIX_RATE_LIMIT_RESET_INTERVAL,
@@ -193,12 +200,19 @@ class MatrixListener(gevent.Greenlet):
 
     def _run(self) -> None:  # pylint: disable=method-hidden
         self._start_client()
+        self._message_worker = gevent.spawn(self._process_queued_messages)
 
         self.client.start_listener_thread()
         self.client.sync_thread.get()
 
     def stop(self) -> None:
         self.client.stop_listener_thread()
+        if self._message_worker is not None:
+            self._message_worker.kill()
+
+    def _process_queued_messages(self) -> None:
+        for message in self._message_queue:
+            self.message_received_callback(message)
 
     def _start_client(self) -> None:
         try:
@@ -291,6 +305,12 @@ class MatrixListener(gevent.Greenlet):
             log.debug(
                 "Message received", message=message, sender=to_checksum_address(message.sender)
             )
-            self.message_received_callback(message)
+            try:
+                self._message_queue.put_nowait(message)
+            except Full:
+                log.warning(
+                    "Message queue is full, dropping message",
+                    sender=to_checksum_address(message.sender),
+                )
 
         return True
@@ -1,9 +1,28 @@
+from functools import lru_cache
 from typing import Union
+from weakref import WeakKeyDictionary
 
 from coincurve import PrivateKey, PublicKey
 from eth_utils import keccak, to_bytes
+from web3 import Web3
 
-from raiden.utils.typing import Address
+from raiden.utils.typing import Address, ChainID
+
+_chain_id_cache: "WeakKeyDictionary[Web3, ChainID]" = WeakKeyDictionary()
+
+
+def get_web3_chain_id(web3: Web3) -> ChainID:
+    """ Returns the chain id of the connected node, cached per Web3 instance.
+
+    The chain id can't change during a run, but `web3.net.version` performs
+    an RPC request on every access. Caching avoids repeating that request
+    when several components are initialized against the same node.
+    """
+    chain_id = _chain_id_cache.get(web3)
+    if chain_id is None:
+        chain_id = ChainID(int(web3.net.version))
+        _chain_id_cache[web3] = chain_id
+    return chain_id
 
 
 def public_key_to_address(public_key: PublicKey) -> Address:
@@ -12,8 +31,14 @@ def public_key_to_address(public_key: PublicKey) -> Address:
     return Address(keccak(key_bytes[1:])[-20:])
 
 
+@lru_cache(maxsize=50)
 def private_key_to_address(private_key: Union[str, bytes]) -> Address:
-    """ Converts a private key to an Ethereum address. """
+    """ Converts a private key to an Ethereum address.
+
+    The underlying secp256k1 scalar multiplication is not cheap, and the
+    same few keys are converted over and over (especially in the tests),
+    so the results are cached.
+    """
     if isinstance(private_key, str):
         private_key = to_bytes(hexstr=private_key)
 
@@ -63,6 +63,12 @@ class RequestCollector(gevent.Greenlet):
         assert request_monitoring.non_closing_signature is not None
         assert request_monitoring.reward_proof_signature is not None
 
+        # Reject requests for the wrong chain before converting to a
+        # MonitorRequest, whose constructor runs three signature recoveries.
+        if request_monitoring.balance_proof.chain_id != self.chain_id:
+            log.debug("Bad chain_id", monitor_request=request_monitoring, expected=self.chain_id)
+            return
+
         # Convert Raiden's RequestMonitoring object to a MonitorRequest
         try:
             monitor_request = MonitorRequest(
@@ -86,9 +92,6 @@ class RequestCollector(gevent.Greenlet):
             return
 
         # Validate MR
-        if monitor_request.chain_id != self.chain_id:
-            log.debug("Bad chain_id", monitor_request=monitor_request, expected=self.chain_id)
-            return
         if monitor_request.non_closing_signer != monitor_request.reward_proof_signer:
             log.debug("The two MR signatures don't match", monitor_request=monitor_request)
             return
@@ -14,7 +14,7 @@ def create_tnr_contract_events_query(
         return query_blockchain_events(
             web3=web3,
             contract_manager=contract_manager,
-            contract_address=contract_address,
+            contract_addresses=[contract_address],
             contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
             topics=[],
             from_block=BlockNumber(0),
@@ -43,7 +43,7 @@ def test_limit_inclusivity_in_query_blockchain_events(
     events = query_blockchain_events(
         web3=web3,
         contract_manager=contracts_manager,
-        contract_address=token_network_registry_contract.address,
+        contract_addresses=[token_network_registry_contract.address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=[],
         from_block=BlockNumber(0),
@@ -54,7 +54,7 @@ def test_limit_inclusivity_in_query_blockchain_events(
     events = query_blockchain_events(
         web3=web3,
         contract_manager=contracts_manager,
-        contract_address=token_network_registry_contract.address,
+        contract_addresses=[token_network_registry_contract.address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=[],
         from_block=BlockNumber(0),
@@ -71,7 +71,7 @@ def test_limit_inclusivity_in_query_blockchain_events(
     events = query_blockchain_events(
         web3=web3,
         contract_manager=contracts_manager,
-        contract_address=token_network_registry_contract.address,
+        contract_addresses=[token_network_registry_contract.address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=[],
         from_block=BlockNumber(registry_event_block + 1),
@@ -82,7 +82,7 @@ def test_limit_inclusivity_in_query_blockchain_events(
     events = query_blockchain_events(
         web3=web3,
         contract_manager=contracts_manager,
-        contract_address=token_network_registry_contract.address,
+        contract_addresses=[token_network_registry_contract.address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=[],
         from_block=registry_event_block,
@@ -94,7 +94,7 @@ def test_limit_inclusivity_in_query_blockchain_events(
     events = query_blockchain_events(
         web3=web3,
         contract_manager=contracts_manager,
-        contract_address=token_network_registry_contract.address,
+        contract_addresses=[token_network_registry_contract.address],
         contract_name=CONTRACT_TOKEN_NETWORK_REGISTRY,
         topics=[],
         from_block=registry_event_block,
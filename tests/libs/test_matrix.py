@@ -6,9 +6,11 @@ import time
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
+import gevent
 import pytest
 from eth_utils import decode_hex, encode_hex, to_canonical_address
 
+from monitoring_service.constants import MATRIX_MAX_QUEUED_MESSAGES
 from monitoring_service.states import HashedBalanceProof
 from raiden.exceptions import InvalidProtocolMessage
 from raiden.messages import RequestMonitoring
@@ -188,3 +190,62 @@ def test_matrix_lister_smoke_test(get_accounts, get_private_key):
         listener._start_client()  # pylint: disable=protected-access
 
     assert listener.startup_finished.is_set()
+
+
+def test_matrix_listener_message_queue(
+    request_monitoring_message, get_accounts, get_private_key, capsys
+):  # pylint: disable=protected-access
+    """ Messages are queued for the worker; overflow is dropped, not blocked on. """
+    c1, = get_accounts(1)
+    url = "http://example.com"
+    client_mock = Mock()
+    client_mock.api.base_url = url
+    client_mock.user_id = "1"
+    received: list = []
+    with patch.multiple(
+        "raiden_libs.matrix",
+        get_matrix_servers=Mock(return_value=[url]),
+        make_client=Mock(return_value=client_mock),
+        join_global_room=Mock(),
+    ):
+        listener = MatrixListener(
+            private_key=get_private_key(c1),
+            chain_id=ChainID(1),
+            service_room_suffix="_service",
+            message_received_callback=received.append,
+        )
+
+    event = {
+        "type": "m.room.message",
+        "sender": "@user:homeserver",
+        "content": {
+            "msgtype": "m.text",
+            "body": json.dumps(DictSerializer.serialize(request_monitoring_message)),
+        },
+    }
+
+    with patch(
+        "raiden_libs.matrix.validate_userid_signature",
+        return_value=request_monitoring_message.sender,
+    ):
+        # while there is room in the queue, messages are queued
+        assert listener._handle_message(room=None, event=event)
+        assert listener._message_queue.qsize() == 1
+
+        # fill the queue to capacity, the overflowing message is dropped
+        # with a warning instead of blocking the sync thread
+        while not listener._message_queue.full():
+            listener._message_queue.put_nowait(request_monitoring_message)
+        assert listener._handle_message(room=None, event=event)
+        assert listener._message_queue.qsize() == MATRIX_MAX_QUEUED_MESSAGES
+        assert "Message queue is full" in capsys.readouterr().out
+
+    # the worker greenlet drains the queue into the message callback
+    worker = gevent.spawn(listener._process_queued_messages)
+    timeout = time.monotonic() + 5
+    while not listener._message_queue.empty() and time.monotonic() < timeout:
+        gevent.sleep(0.001)
+    worker.kill()
+
+    assert len(received) == MATRIX_MAX_QUEUED_MESSAGES
+    assert received[0] == request_monitoring_message
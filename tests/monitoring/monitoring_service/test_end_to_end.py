@@ -22,7 +22,7 @@ def create_ms_contract_events_query(
         return query_blockchain_events(
             web3=web3,
             contract_manager=contract_manager,
-            contract_address=contract_address,
+            contract_addresses=[contract_address],
             contract_name=CONTRACT_MONITORING_SERVICE,
             topics=[],
             from_block=BlockNumber(0),
@@ -0,0 +1,71 @@
+import pytest
+
+from monitoring_service.service import MonitoringService
+from raiden_contracts.constants import (
+    CONTRACT_MONITORING_SERVICE,
+    CONTRACT_TOKEN_NETWORK_REGISTRY,
+    CONTRACT_USER_DEPOSIT,
+)
+from raiden_contracts.tests.utils import get_random_privkey
+
+from ...libs.mocks.web3 import ContractMock, Web3Mock
+
+
+def test_poll_interval_backoff():
+    """ The poll interval backs off on quiet ticks, but not while catching up.
+
+    While events keep arriving or the service is still behind the confirmed
+    head, every iteration must run at ``poll_interval``. Only once it is
+    caught up and sees no events, the interval grows by 1.5x per tick up to
+    ``max_poll_interval`` and resets as soon as an event arrives.
+    """
+    web3 = Web3Mock()
+    web3.eth.blockNumber = 350
+
+    ms = MonitoringService(
+        web3=web3,
+        private_key=get_random_privkey(),
+        contracts={
+            CONTRACT_TOKEN_NETWORK_REGISTRY: ContractMock(),
+            CONTRACT_MONITORING_SERVICE: ContractMock(),
+            CONTRACT_USER_DEPOSIT: ContractMock(),
+        },
+        db_filename=":memory:",
+        required_confirmations=0,
+        poll_interval=1,
+        max_poll_interval=4,
+        max_filter_interval=100,
+    )
+
+    # With max_filter_interval=100 the first three iterations only reach
+    # blocks 100, 200 and 300 of the 350 block head, i.e. they are catching
+    # up. The remaining iterations run at the head.
+    saw_events_per_tick = iter([False, False, False, True, False, False, False, False, True])
+
+    def process_new_blocks(last_block):
+        ms.context.ms_state.blockchain_state.latest_known_block = last_block
+        return next(saw_events_per_tick)
+
+    ms._process_new_blocks = process_new_blocks  # pylint: disable=protected-access
+
+    intervals = []
+
+    def wait_function(interval):
+        intervals.append(interval)
+        if len(intervals) == 9:
+            raise KeyboardInterrupt()
+
+    with pytest.raises(SystemExit):
+        ms.start(wait_function=wait_function, check_account_gas_reserve=False)
+
+    assert intervals == [
+        1,  # catching up, no backoff
+        1,  # catching up, no backoff
+        1,  # catching up, no backoff
+        1,  # at the head, saw events
+        1.5,  # quiet tick, backing off
+        2.25,  # quiet tick, backing off
+        3.375,  # quiet tick, backing off
+        4,  # capped at max_poll_interval
+        1,  # events again, reset to poll_interval
+    ]
@@ -1,52 +1,54 @@
 # pylint: disable=redefined-outer-name
-from typing import Callable, Dict, Generator, List
+from typing import Callable, Dict, Generator, List, NamedTuple, Tuple
 from unittest.mock import Mock, patch
 
 import pytest
 from web3 import Web3
 from web3.contract import Contract
 
+from pathfinding_service.model import ChannelView
 from pathfinding_service.model.token_network import TokenNetwork
 from pathfinding_service.service import PathfindingService
-from raiden.constants import EMPTY_SIGNATURE
-from raiden.messages import PFSCapacityUpdate
 from raiden.network.transport.matrix import AddressReachability
-from raiden.transfer.identifiers import CanonicalIdentifier
-from raiden.utils.typing import (
-    Address,
-    ChainID,
-    ChannelID,
-    Nonce,
-    TokenAmount,
-    TokenNetworkAddress,
-)
+from raiden.utils.typing import Address, ChannelID, Nonce, TokenAmount
 from raiden_contracts.constants import CONTRACT_TOKEN_NETWORK_REGISTRY, CONTRACT_USER_DEPOSIT
 
+TEST_PRIVATE_KEY = "3a1076bf45ab87712ad64ccb3b10217737f7faacbf2872e88fdd9a537d8fe266"
+USER_DEPOSIT_ADDRESS = bytes([8] * 20)
+TOKEN_NETWORK_REGISTRY_ADDRESS = bytes([9] * 20)
+TOKEN_NETWORK_REGISTRY_ADDRESS_HEX = "0x" + "9" * 40
+
+
+class ChannelDescription(NamedTuple):
+    """ One channel of a test topology, with the state of both participants.
+
+    Being a NamedTuple, existing tuple literals and unpacking keep working,
+    while consumers can access single fields by name instead of unpacking
+    all thirteen.
+    """
+
+    p1_index: int
+    p1_deposit: int
+    p1_capacity: int
+    p1_fee: int
+    p1_reveal_timeout: int
+    p1_reachability: AddressReachability
+    p2_index: int
+    p2_deposit: int
+    p2_capacity: int
+    p2_fee: int
+    p2_reveal_timeout: int
+    p2_reachability: AddressReachability
+    settle_timeout: int
+
 
 @pytest.fixture(scope="session")
-def channel_descriptions_case_1() -> List:
+def channel_descriptions_case_1() -> List[ChannelDescription]:
     """ Creates a network with some edge cases.
 
     These include disconneced subgraph, depleted channels...
     """
 
-    # Now initialize some channels in this network.
-    # The tuples in channel_descriptions define the following:
-    # (
-    #     p1_index,
-    #     p1_deposit,
-    #     p1_capacity,
-    #     p1_fee,
-    #     p1_reveal_timeout,
-    #     p1_reachability,
-    #     p2_index,
-    #     p2_deposit,
-    #     p2_capacity,
-    #     p2_fee,
-    #     p2_reveal_timeout,
-    #     p2_reachability,
-    #     settle_timeout
-    # )
     # Topology:
     #       /-------------\
     # 0 -- 1 -- 2 -- 3 -- 4    5 -- 6
@@ -55,41 +57,24 @@ def channel_descriptions_case_1() -> List:
     reach = AddressReachability.REACHABLE
 
     channel_descriptions = [
-        (0, 100, 90, 10, 2, reach, 1, 50, 60, 15, 2, reach, 14),  # capacities  90 --  60
-        (1, 40, 130, 8, 2, reach, 2, 130, 40, 12, 2, reach, 14),  # capacities 130 --  40
-        (2, 90, 80, 7, 2, reach, 3, 10, 20, 10, 2, reach, 3),  # capacities  80 --  20
-        (3, 50, 50, 11, 2, reach, 4, 50, 50, 11, 2, reach, 14),  # capacities  50 --  50
-        (0, 40, 0, 15, 2, reach, 2, 80, 120, 25, 2, reach, 14),  # capacities   0 -- 120
-        (1, 30, 35, 100, 2, reach, 4, 40, 35, 18, 2, reach, 14),  # capacities  35 --  35
-        (5, 500, 550, 30, 2, reach, 6, 750, 700, 40, 2, reach, 14),  # capacities 550 -- 700
+        ChannelDescription(0, 100, 90, 10, 2, reach, 1, 50, 60, 15, 2, reach, 14),
+        ChannelDescription(1, 40, 130, 8, 2, reach, 2, 130, 40, 12, 2, reach, 14),
+        ChannelDescription(2, 90, 80, 7, 2, reach, 3, 10, 20, 10, 2, reach, 3),
+        ChannelDescription(3, 50, 50, 11, 2, reach, 4, 50, 50, 11, 2, reach, 14),
+        ChannelDescription(0, 40, 0, 15, 2, reach, 2, 80, 120, 25, 2, reach, 14),
+        ChannelDescription(1, 30, 35, 100, 2, reach, 4, 40, 35, 18, 2, reach, 14),
+        ChannelDescription(5, 500, 550, 30, 2, reach, 6, 750, 700, 40, 2, reach, 14),
     ]
     return channel_descriptions
 
 
-@pytest.fixture
-def channel_descriptions_case_2() -> List:
+@pytest.fixture(scope="session")
+def channel_descriptions_case_2() -> List[ChannelDescription]:
     """ Creates a network with three paths from 0 to 4.
 
     The paths differ in length and cost.
     """
 
-    # Now initialize some channels in this network.
-    # The tuples in channel_descriptions define the following:
-    # (
-    #     p1_index,
-    #     p1_deposit,
-    #     p1_capacity,
-    #     p1_fee,
-    #     p1_reveal_timeout,
-    #     p1_reachability,
-    #     p2_index,
-    #     p2_deposit,
-    #     p2_capacity,
-    #     p2_fee,
-    #     p2_reveal_timeout,
-    #     p2_reachability,
-    #     settle_timeout
-    # )
     # Topology:
     #  /----- 1 ----\
     # 0 -- 2 -- 3 -- 4
@@ -98,67 +83,50 @@ def channel_descriptions_case_2() -> List:
     reach = AddressReachability.REACHABLE
 
     channel_descriptions = [
-        (0, 100, 90, 3000, 2, reach, 1, 50, 60, 3000, 2, reach, 15),  # capacities  90 --  60
-        (1, 40, 130, 2000, 2, reach, 4, 130, 40, 2000, 2, reach, 15),  # capacities 130 --  40
-        (0, 90, 80, 1000, 2, reach, 2, 10, 10, 1000, 2, reach, 15),  # capacities  80 --  10
-        (2, 50, 50, 1500, 2, reach, 3, 50, 50, 1500, 2, reach, 15),  # capacities  50 --  50
-        (3, 100, 60, 1000, 2, reach, 4, 80, 120, 1000, 2, reach, 15),  # capacities  60 -- 120
-        (2, 30, 35, 1000, 2, reach, 5, 40, 35, 1000, 2, reach, 15),  # capacities  35 --  35
-        (5, 500, 550, 1000, 2, reach, 4, 750, 700, 1000, 2, reach, 15),  # capacities 550 -- 700
+        ChannelDescription(0, 100, 90, 3000, 2, reach, 1, 50, 60, 3000, 2, reach, 15),
+        ChannelDescription(1, 40, 130, 2000, 2, reach, 4, 130, 40, 2000, 2, reach, 15),
+        ChannelDescription(0, 90, 80, 1000, 2, reach, 2, 10, 10, 1000, 2, reach, 15),
+        ChannelDescription(2, 50, 50, 1500, 2, reach, 3, 50, 50, 1500, 2, reach, 15),
+        ChannelDescription(3, 100, 60, 1000, 2, reach, 4, 80, 120, 1000, 2, reach, 15),
+        ChannelDescription(2, 30, 35, 1000, 2, reach, 5, 40, 35, 1000, 2, reach, 15),
+        ChannelDescription(5, 500, 550, 1000, 2, reach, 4, 750, 700, 1000, 2, reach, 15),
     ]
     return channel_descriptions
 
 
-@pytest.fixture
-def channel_descriptions_case_3() -> List:
-    """ Creates a network partly overlapping paths from 0 to 8 """
-
-    # Now initialize some channels in this network.
-    # The tuples in channel_descriptions define the following:
-    # (
-    #     p1_index,
-    #     p1_deposit,
-    #     p1_capacity,
-    #     p1_fee,
-    #     p1_reveal_timeout,
-    #     p1_reachability,
-    #     p2_index,
-    #     p2_deposit,
-    #     p2_capacity,
-    #     p2_fee,
-    #     p2_reveal_timeout,
-    #     p2_reachability,
-    #     settle_timeout
-    # )
-    # Topology:
-    #    /- 1 - 2 - 3 - 4 --\
-    #   /          /-- 5 -\ |
-    #  /      /--- 6 ---\ / |
-    # 0----- 7 --------- 8 -/
-    #         \- 9 - 10 -/
+# Case 3 is a uniform topology, so it can be fully built at import time
+# instead of re-running the comprehension in the fixture. Topology:
+#    /- 1 - 2 - 3 - 4 --\
+#   /          /-- 5 -\ |
+#  /      /--- 6 ---\ / |
+# 0----- 7 --------- 8 -/
+#         \- 9 - 10 -/
+_REACH = AddressReachability.REACHABLE
+CHANNEL_DESCRIPTIONS_CASE_3 = tuple(
+    ChannelDescription(a, 100, 100, 0, 2, _REACH, b, 100, 100, 0, 2, _REACH, 15)
+    for a, b in [
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 8),
+        (0, 7),
+        (7, 6),
+        (7, 8),
+        (7, 9),
+        (9, 10),
+        (10, 8),
+        (5, 8),
+        (6, 5),
+        (6, 8),
+    ]
+)
 
-    reach = AddressReachability.REACHABLE
 
-    channel_descriptions = [
-        (a, 100, 100, 0, 2, reach, b, 100, 100, 0, 2, reach, 15)
-        for a, b in [
-            (0, 1),
-            (1, 2),
-            (2, 3),
-            (3, 4),
-            (4, 8),
-            (0, 7),
-            (7, 6),
-            (7, 8),
-            (7, 9),
-            (9, 10),
-            (10, 8),
-            (5, 8),
-            (6, 5),
-            (6, 8),
-        ]
-    ]
-    return channel_descriptions
+@pytest.fixture(scope="session")
+def channel_descriptions_case_3() -> Tuple[ChannelDescription, ...]:
+    """ Creates a network partly overlapping paths from 0 to 8 """
+    return CHANNEL_DESCRIPTIONS_CASE_3
 
 
 @pytest.fixture(scope="session")
@@ -168,152 +136,144 @@ def populate_token_network() -> Callable:
         token_network: TokenNetwork,
         address_to_reachability: Dict[Address, AddressReachability],
         addresses: List[Address],
-        channel_descriptions: List,
+        channel_descriptions: List[ChannelDescription],
     ):
-        for (
-            channel_id,
-            (
-                p1_index,
-                p1_deposit,
-                p1_capacity,
-                _p1_fee,
-                p1_reveal_timeout,
-                p1_reachability,
-                p2_index,
-                p2_deposit,
-                p2_capacity,
-                _p2_fee,
-                p2_reveal_timeout,
-                p2_reachability,
-                settle_timeout,
-            ),
-        ) in enumerate(channel_descriptions):
-            participant1 = addresses[p1_index]
-            participant2 = addresses[p2_index]
-            token_network.handle_channel_opened_event(
-                channel_identifier=ChannelID(channel_id),
+        # The channel views are built directly and registered in one batch
+        # instead of going through the per-event handlers and per-channel
+        # PFSCapacityUpdate messages. The end state of the graph is the
+        # same, the overhead of message construction and repeated graph
+        # lookups is not paid.
+        channel_views = []
+        for channel_id, description in enumerate(channel_descriptions):
+            participant1 = addresses[description.p1_index]
+            participant2 = addresses[description.p2_index]
+            view1 = ChannelView(
+                token_network_address=token_network.address,
+                channel_id=ChannelID(channel_id),
                 participant1=participant1,
                 participant2=participant2,
-                settle_timeout=settle_timeout,
+                settle_timeout=description.settle_timeout,
+                deposit=TokenAmount(description.p1_deposit),
             )
-
-            token_network.handle_channel_new_deposit_event(
-                channel_identifier=ChannelID(channel_id),
-                receiver=participant1,
-                total_deposit=p1_deposit,
-            )
-            token_network.handle_channel_new_deposit_event(
-                channel_identifier=ChannelID(channel_id),
-                receiver=participant2,
-                total_deposit=p2_deposit,
+            view1.update_capacity(
+                capacity=TokenAmount(description.p1_capacity),
+                nonce=Nonce(1),
+                reveal_timeout=description.p1_reveal_timeout,
             )
-
-            token_network.handle_channel_balance_update_message(
-                PFSCapacityUpdate(
-                    canonical_identifier=CanonicalIdentifier(
-                        chain_identifier=ChainID(1),
-                        channel_identifier=ChannelID(channel_id),
-                        token_network_address=TokenNetworkAddress(token_network.address),
-                    ),
-                    updating_participant=addresses[p1_index],
-                    other_participant=addresses[p2_index],
-                    updating_nonce=Nonce(1),
-                    other_nonce=Nonce(1),
-                    updating_capacity=p1_capacity,
-                    other_capacity=p2_capacity,
-                    reveal_timeout=p1_reveal_timeout,
-                    signature=EMPTY_SIGNATURE,
-                ),
-                updating_capacity_partner=TokenAmount(0),
-                other_capacity_partner=TokenAmount(0),
+            view2 = ChannelView(
+                token_network_address=token_network.address,
+                channel_id=ChannelID(channel_id),
+                participant1=participant2,
+                participant2=participant1,
+                settle_timeout=description.settle_timeout,
+                deposit=TokenAmount(description.p2_deposit),
             )
-            token_network.handle_channel_balance_update_message(
-                PFSCapacityUpdate(
-                    canonical_identifier=CanonicalIdentifier(
-                        chain_identifier=ChainID(1),
-                        channel_identifier=ChannelID(channel_id),
-                        token_network_address=TokenNetworkAddress(token_network.address),
-                    ),
-                    updating_participant=addresses[p2_index],
-                    other_participant=addresses[p1_index],
-                    updating_nonce=Nonce(2),
-                    other_nonce=Nonce(1),
-                    updating_capacity=p2_capacity,
-                    other_capacity=p1_capacity,
-                    reveal_timeout=p2_reveal_timeout,
-                    signature=EMPTY_SIGNATURE,
-                ),
-                updating_capacity_partner=TokenAmount(p1_capacity),
-                other_capacity_partner=TokenAmount(p2_capacity),
+            view2.update_capacity(
+                capacity=TokenAmount(description.p2_capacity),
+                nonce=Nonce(2),
+                reveal_timeout=description.p2_reveal_timeout,
             )
+            channel_views.extend((view1, view2))
 
             # Update presence state according to scenario
-            address_to_reachability[participant1] = p1_reachability
-            address_to_reachability[participant2] = p2_reachability
+            address_to_reachability[participant1] = description.p1_reachability
+            address_to_reachability[participant2] = description.p2_reachability
+
+        token_network.add_channel_views(channel_views)
 
     return populate_token_network
 
 
 @pytest.fixture
-def populate_token_network_case_1(
+def populate_case(
+    request,
     populate_token_network: Callable,
     token_network_model: TokenNetwork,
     address_to_reachability: Dict[Address, AddressReachability],
     addresses: List[Address],
-    channel_descriptions_case_1: List,
-):
-    populate_token_network(
-        token_network_model, address_to_reachability, addresses, channel_descriptions_case_1
-    )
+) -> Callable:
+    """ Populates the token network model with the given topology case. """
+
+    def populate(case_number: int) -> None:
+        channel_descriptions = request.getfixturevalue(f"channel_descriptions_case_{case_number}")
+        populate_token_network(
+            token_network_model, address_to_reachability, addresses, channel_descriptions
+        )
+
+    return populate
 
 
 @pytest.fixture
-def populate_token_network_case_2(
-    populate_token_network: Callable,
-    token_network_model: TokenNetwork,
-    address_to_reachability: Dict[Address, AddressReachability],
-    addresses: List[Address],
-    channel_descriptions_case_2: List,
-):
-    populate_token_network(
-        token_network_model, address_to_reachability, addresses, channel_descriptions_case_2
-    )
+def populate_token_network_case_1(populate_case: Callable) -> None:
+    populate_case(1)
 
 
 @pytest.fixture
-def populate_token_network_case_3(
-    populate_token_network: Callable,
-    token_network_model: TokenNetwork,
-    address_to_reachability: Dict[Address, AddressReachability],
-    addresses: List[Address],
-    channel_descriptions_case_3: List,
-):
-    populate_token_network(
-        token_network_model, address_to_reachability, addresses, channel_descriptions_case_3
-    )
+def populate_token_network_case_2(populate_case: Callable) -> None:
+    populate_case(2)
 
 
 @pytest.fixture
-def pathfinding_service_mock_empty() -> Generator[PathfindingService, None, None]:
-    with patch("pathfinding_service.service.MatrixListener", new=Mock):
-        web3_mock = Mock()
-        web3_mock.net.version = "1"
-        web3_mock.eth.blockNumber = 1
+def populate_token_network_case_3(populate_case: Callable) -> None:
+    populate_case(3)
+
 
-        mock_udc = Mock(address=bytes([8] * 20))
-        mock_udc.functions.effectiveBalance.return_value.call.return_value = 10000
+@pytest.fixture(scope="session")
+def _pathfinding_service_mock_session() -> Generator[PathfindingService, None, None]:
+    """ Builds the mocked PathfindingService once per session.
+
+    Use `pathfinding_service_mock_empty` instead, which resets the service
+    to a pristine state for each test.
+    """
+    web3_mock = Mock()
+    web3_mock.net.version = "1"
+    web3_mock.eth.blockNumber = 1
+
+    mock_udc = Mock(address=USER_DEPOSIT_ADDRESS)
+    mock_udc.functions.effectiveBalance.return_value.call.return_value = 10000
+
+    # The patch is only needed while the constructor instantiates the
+    # listener. It must not span the yield, or MatrixListener would stay
+    # mocked for the rest of the session.
+    with patch("pathfinding_service.service.MatrixListener", new=Mock):
         pathfinding_service = PathfindingService(
             web3=web3_mock,
             contracts={
-                CONTRACT_TOKEN_NETWORK_REGISTRY: Mock(address=bytes([9] * 20)),
+                CONTRACT_TOKEN_NETWORK_REGISTRY: Mock(address=TOKEN_NETWORK_REGISTRY_ADDRESS),
                 CONTRACT_USER_DEPOSIT: mock_udc,
             },
-            private_key="3a1076bf45ab87712ad64ccb3b10217737f7faacbf2872e88fdd9a537d8fe266",
+            private_key=TEST_PRIVATE_KEY,
             db_filename=":memory:",
         )
 
-        yield pathfinding_service
-        pathfinding_service.stop()
+    yield pathfinding_service
+    pathfinding_service.stop()
+
+
+@pytest.fixture
+def pathfinding_service_mock_empty(
+    _pathfinding_service_mock_session: PathfindingService,
+) -> Generator[PathfindingService, None, None]:
+    # Constructing a PathfindingService means deriving the keypair and
+    # creating the db schema, which is too expensive to repeat for every
+    # test. Reuse the session-scoped instance and reset its state instead.
+    pathfinding_service = _pathfinding_service_mock_session
+    pathfinding_service.token_networks = {}
+    pathfinding_service.address_to_reachability = {}
+    pathfinding_service.matrix_listener = Mock()
+    pathfinding_service.database.conn.executescript(
+        """
+        DELETE FROM waiting_message;
+        DELETE FROM channel_view;
+        DELETE FROM capacity_update;
+        DELETE FROM iou;
+        DELETE FROM feedback;
+        DELETE FROM token_network;
+        UPDATE blockchain SET latest_known_block = 0;
+        """
+    )
+
+    yield pathfinding_service
 
 
 @pytest.fixture
@@ -337,10 +297,10 @@ def pathfinding_service_web3_mock(
         pathfinding_service = PathfindingService(
             web3=web3,
             contracts={
-                CONTRACT_TOKEN_NETWORK_REGISTRY: Mock(address="0x" + "9" * 40),
+                CONTRACT_TOKEN_NETWORK_REGISTRY: Mock(address=TOKEN_NETWORK_REGISTRY_ADDRESS_HEX),
                 CONTRACT_USER_DEPOSIT: user_deposit_contract,
             },
-            private_key="3a1076bf45ab87712ad64ccb3b10217737f7faacbf2872e88fdd9a537d8fe266",
+            private_key=TEST_PRIVATE_KEY,
             db_filename=":memory:",
         )
 
@@ -4,10 +4,12 @@ processes them. Additionally, it mocks the transport layer directly. It tests th
 interaction of many moving parts - yet, it is currently really slow.
 Therefore, usually mocked_integration should be used.
 """
-from typing import List
+import time
+from typing import Callable, List
 from unittest.mock import Mock, patch
 
 import gevent
+import pytest
 from eth_utils import decode_hex, encode_hex
 
 from monitoring_service.states import HashedBalanceProof
@@ -22,11 +24,32 @@ from raiden_contracts.constants import (
     TEST_SETTLE_TIMEOUT_MIN,
 )
 
+from .fixtures.network_service import TEST_PRIVATE_KEY, ChannelDescription
 
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5.0, step: float = 0.005) -> None:
+    """ Waits until the predicate holds, failing the test after `timeout` seconds.
+
+    In contrast to a fixed `gevent.sleep`, this returns as soon as the
+    service has caught up.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out while waiting for the service to catch up"
+        gevent.sleep(step)
+
+
+@pytest.fixture
+def channel_descriptions(request) -> List[ChannelDescription]:
+    """ Dispatches to the channel_descriptions_case_* fixture chosen via params. """
+    return request.getfixturevalue(f"channel_descriptions_case_{request.param}")
+
+
+@pytest.mark.parametrize("channel_descriptions", [1, 2, 3], indirect=True)
 def test_pfs_with_mocked_client(  # pylint: disable=too-many-arguments
     web3,
     token_network_registry_contract,
-    channel_descriptions_case_1: List,
+    channel_descriptions: List[ChannelDescription],
     get_accounts,
     wait_for_blocks,
     user_deposit_contract,
@@ -40,7 +63,10 @@ def test_pfs_with_mocked_client(  # pylint: disable=too-many-arguments
     Mocks blockchain events to setup a token network with a given topology, specified in
     the channel_description fixture. Tests all PFS methods w.r.t. to that topology
     """
-    clients = get_accounts(7)
+    number_of_clients = 1 + max(
+        max(description.p1_index, description.p2_index) for description in channel_descriptions
+    )
+    clients = get_accounts(number_of_clients)
     token_network_address = decode_hex(token_network.address)
 
     with patch("pathfinding_service.service.MatrixListener", new=Mock):
@@ -54,132 +80,115 @@ def test_pfs_with_mocked_client(  # pylint: disable=too-many-arguments
             db_filename=":memory:",
             poll_interval=0.1,
             sync_start_block=BlockNumber(0),
-            private_key="3a1076bf45ab87712ad64ccb3b10217737f7faacbf2872e88fdd9a537d8fe266",
+            private_key=TEST_PRIVATE_KEY,
         )
 
     # greenlet needs to be started and context switched to
     pfs.start()
     wait_for_blocks(1)
-    gevent.sleep(0.1)
 
     # there should be one token network registered
-    assert len(pfs.token_networks) == 1
+    wait_until(lambda: len(pfs.token_networks) == 1)
 
     token_network_model = pfs.token_networks[token_network_address]
-    graph = token_network_model.G
     channel_identifiers = []
-    for (
-        p1_index,
-        p1_deposit,
-        _p1_capacity,
-        _p1_fee,
-        _p1_reveal_timeout,
-        _p1_reachability,
-        p2_index,
-        p2_deposit,
-        _p2_capacity,
-        _p2_fee,
-        _p2_reveal_timeout,
-        _p2_reachability,
-        _settle_timeout,
-    ) in channel_descriptions_case_1:
+    for description in channel_descriptions:
+        p1_client = clients[description.p1_index]
+        p2_client = clients[description.p2_index]
         # order is important here because we check order later
-        channel_id = create_channel(clients[p1_index], clients[p2_index])[0]
+        channel_id = create_channel(p1_client, p2_client)[0]
         channel_identifiers.append(channel_id)
 
+    # Fund the channels with pre-signed transactions submitted without
+    # waiting for individual receipts. Per-account ordering is guaranteed by
+    # the consecutive nonces, so mint/approve/setTotalDeposit still execute
+    # in order while the many receipt round trips of `transact` are avoided.
+    gas_price = web3.eth.gasPrice
+    priv_keys = {client: get_private_key(client) for client in clients}
+    nonces = {client: web3.eth.getTransactionCount(client) for client in clients}
+
+    def submit_signed(contract_function, sender):
+        transaction = contract_function.buildTransaction(
+            {"from": sender, "nonce": nonces[sender], "gas": 300_000, "gasPrice": gas_price}
+        )
+        nonces[sender] += 1
+        signed = web3.eth.account.signTransaction(transaction, priv_keys[sender])
+        web3.eth.sendRawTransaction(signed.rawTransaction)
+
+    for index, description in enumerate(channel_descriptions):
+        channel_id = channel_identifiers[index]
+        p1_client = clients[description.p1_index]
+        p2_client = clients[description.p2_index]
         for address, partner_address, amount in [
-            (clients[p1_index], clients[p2_index], p1_deposit),
-            (clients[p2_index], clients[p1_index], p2_deposit),
+            (p1_client, p2_client, description.p1_deposit),
+            (p2_client, p1_client, description.p2_deposit),
         ]:
-            custom_token.functions.mint(amount).transact({"from": address})
-            custom_token.functions.approve(token_network.address, amount).transact(
-                {"from": address}
+            submit_signed(custom_token.functions.mint(amount), address)
+            submit_signed(custom_token.functions.approve(token_network.address, amount), address)
+            submit_signed(
+                token_network.functions.setTotalDeposit(
+                    channel_id, address, amount, partner_address
+                ),
+                address,
             )
-            token_network.functions.setTotalDeposit(
-                channel_id, address, amount, partner_address
-            ).transact({"from": address})
-        gevent.sleep()
     wait_for_blocks(1)
-    gevent.sleep(0.1)
 
-    # there should be as many open channels as described
-    assert len(token_network_model.channel_id_to_addresses.keys()) == len(
-        channel_descriptions_case_1
-    )
+    # Wait until all channels and the deposit of the last submitted
+    # transaction are registered. Deposits are processed in submission
+    # order, so the last one implies all earlier ones.
+    def all_deposits_registered() -> bool:
+        if len(token_network_model.channel_id_to_addresses) != len(channel_descriptions):
+            return False
+        p1_address, p2_address = token_network_model.channel_id_to_addresses[
+            channel_identifiers[-1]
+        ]
+        last_p2_deposit = channel_descriptions[-1].p2_deposit
+        return token_network_model.view(p2_address, p1_address).deposit == last_p2_deposit
+
+    wait_until(all_deposits_registered)
 
     # check that deposits, settle_timeout and transfers got registered
-    for (
-        index,
-        (
-            _p1_index,
-            p1_deposit,
-            _p1_capacity,
-            _p1_fee,
-            _p1_reveal_timeout,
-            _p1_reachability,
-            _p2_index,
-            p2_deposit,
-            _p2_capacity,
-            _p2_fee,
-            _p2_reveal_timeout,
-            _p2_reachability,
-            _settle_timeout,
-        ),
-    ) in enumerate(channel_descriptions_case_1):
+    for index, description in enumerate(channel_descriptions):
         channel_identifier = channel_identifiers[index]
         p1_address, p2_address = token_network_model.channel_id_to_addresses[channel_identifier]
-        view1: ChannelView = graph[p1_address][p2_address]["view"]
-        view2: ChannelView = graph[p2_address][p1_address]["view"]
-        assert view1.deposit == p1_deposit
-        assert view2.deposit == p2_deposit
+        view1: ChannelView = token_network_model.view(p1_address, p2_address)
+        view2: ChannelView = token_network_model.view(p2_address, p1_address)
+        assert view1.deposit == description.p1_deposit
+        assert view2.deposit == description.p2_deposit
         assert view1.settle_timeout == TEST_SETTLE_TIMEOUT_MIN
         assert view2.settle_timeout == TEST_SETTLE_TIMEOUT_MIN
         assert view1.reveal_timeout == DEFAULT_REVEAL_TIMEOUT
         assert view2.reveal_timeout == DEFAULT_REVEAL_TIMEOUT
 
     # now close all channels
-    for (
-        index,
-        (
-            p1_index,
-            _p1_deposit,
-            _p1_capacity,
-            _p1_fee,
-            _p1_reveal_timeout,
-            _p1_reachability,
-            p2_index,
-            _p2_deposit,
-            _p2_capacity,
-            _p2_fee,
-            _p2_reveal_timeout,
-            _p2_reachability,
-            _settle_timeout,
-        ),
-    ) in enumerate(channel_descriptions_case_1):
+    additional_hash = "0x%064x" % 0
+    locksroot = encode_hex(LOCKSROOT_OF_NO_LOCKS)
+    for index, description in enumerate(channel_descriptions):
         channel_id = channel_identifiers[index]
+        p1_client = clients[description.p1_index]
+        p2_client = clients[description.p2_index]
         balance_proof = HashedBalanceProof(
             nonce=Nonce(1),
             transferred_amount=0,
-            priv_key=get_private_key(clients[p2_index]),
+            priv_key=priv_keys[p2_client],
             channel_identifier=channel_id,
             token_network_address=token_network.address,
             chain_id=ChainID(1),
-            additional_hash="0x%064x" % 0,
+            additional_hash=additional_hash,
             locked_amount=0,
-            locksroot=encode_hex(LOCKSROOT_OF_NO_LOCKS),
+            locksroot=locksroot,
         )
         token_network.functions.closeChannel(
             channel_id,
-            clients[p2_index],
+            p2_client,
             balance_proof.balance_hash,
             balance_proof.nonce,
             balance_proof.additional_hash,
             balance_proof.signature,
-        ).transact({"from": clients[p1_index], "gas": 200_000})
+        ).transact({"from": p1_client, "gas": 200_000})
 
     wait_for_blocks(1)
-    gevent.sleep(0.1)
 
     # there should be no channels
-    assert len(token_network_model.channel_id_to_addresses.keys()) == 0
+    wait_until(lambda: len(token_network_model.channel_id_to_addresses) == 0)
     pfs.stop()